@@ -1,4 +1,6 @@
 all = [
       "downgsod.py",
+      "checkgsod.py",
+      "gsodformat.py",
 ]
 __version__ = '0.1.0'
\ No newline at end of file
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+#  class to check the integrity of downloaded GSOD data
+#
+#  (c) Copyright Luca Delucchi 2012
+#  Authors: Luca Delucchi
+#  Email: luca dot delucchi at fmach dot it
+#
+##################################################################
+#
+#  This GSOD Python class is licensed under the terms of GNU GPL 2.
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License as
+#  published by the Free Software Foundation; either version 2 of
+#  the License, or (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+##################################################################
+
+import os
+import re
+import glob
+import gzip
+import zlib
+import struct
+import socket
+import ftplib
+import logging
+import multiprocessing
+
+from pygsod.gsodformat import input_format
+
+# the first characters of header line
+header_start = 'STN---'
+
+def layoutPattern():
+    """ Create the regular expression of a data line from input_format,
+    numeric fields must contain at least one digit inside the field """
+    pattern = '^'
+    pos = 1
+    for (field,start,end,conv,type) in input_format:
+        # characters between two fields
+        if start > pos:
+            pattern += '.{%i}' % (start - pos)
+        width = end - start + 1
+        if type == 'INTEGER':
+            pattern += '(?=[ ]{0,%i}[0-9])[ 0-9]{%i}' % (width - 1, width)
+        elif type == 'FLOAT':
+            pattern += '(?=[ ]{0,%i}[0-9]|[ ]{0,%i}-[0-9])[ 0-9.-]{%i}' % (
+                        width - 1, width - 2, width)
+        else:
+            pattern += '.{%i}' % width
+        pos = end + 1
+    return re.compile(pattern)
+
+line_layout = layoutPattern()
+
+def checkFile(filename):
+    """ Decompress a GSOD file line by line and check the header and the
+    layout of data, return a tuple with the name of file and the error
+    found or None if the file is valid """
+    name = os.path.basename(filename)
+    try:
+        stn, wban, year = name.split('.')[0].split('-')
+    except ValueError:
+        return (name, "the name is not a GSOD file name")
+    # the first characters of each data line
+    prefix = "%s %s  %s" % (stn, wban, year)
+    try:
+        fil = gzip.open(filename)
+        try:
+            nline = 0
+            for line in fil:
+                nline += 1
+                if nline == 1:
+                    if not line.startswith(header_start):
+                        return (name, "header not valid")
+                elif not line.startswith(prefix):
+                    return (name, "line %i of a different station or " \
+                            "year" % nline)
+                elif not line_layout.match(line):
+                    return (name, "line %i not valid" % nline)
+        finally:
+            fil.close()
+    except (IOError, EOFError, zlib.error, struct.error), e:
+        return (name, "gzip error: %s" % e)
+    if nline < 2:
+        return (name, "no data")
+    return (name, None)
+
+class checkGSOD:
+    """A class to check the integrity of downloaded GSOD data"""
+    def __init__(self,
+                    folder,
+                    processes = None,
+                    debug = False
+                ):
+        """Initialization function :
+            folder = where the GSOD files are stored
+            processes = the number of processes used to check the files;
+                        by default the number of CPUs
+            debug = to see more info about checking
+        """
+        # set folder to check
+        if os.path.isdir(folder):
+            self.folder = folder
+        else:
+            raise IOError("Folder with GSOD files does not exist")
+        # number of processes
+        self.processes = processes
+        # for debug
+        self.debug = debug
+        # all files to check
+        self.files = sorted(glob.glob1(self.folder, "*.op.gz"))
+        # files not valid, the value is the error
+        self.errors = {}
+        if self.debug == True:
+            logging.debug("The number of files to check is: %i" % len(self.files))
+
+    def checkLocal(self):
+        """ Check all files using a pool of processes """
+        pool = multiprocessing.Pool(self.processes)
+        paths = [os.path.join(self.folder, f) for f in self.files]
+        try:
+            # send the files in chunks to reduce the overhead of the pool
+            for name, error in pool.imap_unordered(checkFile, paths, 64):
+                if error:
+                    self.errors[name] = error
+                    logging.error("The file %s is not valid: %s" % (name, error))
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+        if self.debug == True:
+            logging.debug("The number of files not valid is: %i" % len(self.errors))
+        return self.errors
+
+    def connectFTP(self, password, user = "anonymous",
+                   url = "ftp.ncdc.noaa.gov", path = "pub/data/gsod"):
+        """ Set connection to ftp server and move to path where data are
+        stored, it does not touch any file of the download folder """
+        self.ftp = ftplib.FTP(url)
+        self.ftp.login(user, password)
+        self.ftp.cwd(path)
+        if self.debug == True:
+            logging.debug("Open connection %s" % url)
+
+    def closeFTP(self):
+        """ Close ftp connection """
+        try:
+            self.ftp.quit()
+        except:
+            pass
+
+    def getFilesSize(self, year):
+        """ Return a dictionary with the size in bytes of all files of the
+        year, the keys are the name of files """
+        listfilesall = []
+        try:
+            # return the long listing of directory
+            self.ftp.dir(year, listfilesall.append)
+        except (ftplib.error_reply, ftplib.error_perm, socket.error), e:
+            logging.error("Error %s listing directory %s" % (e, year))
+        sizes = {}
+        for elem in listfilesall:
+            items = elem.split()
+            # only files, the size is the fifth column
+            if elem.startswith("-") and len(items) > 8:
+                sizes[items[-1]] = int(items[4])
+        return sizes
+
+    def checkRemote(self):
+        """ Compare the size of files with the remote listing, connectFTP
+        has to be called before """
+        # group the files by year
+        years = {}
+        for f in self.files:
+            years.setdefault(f.split('.')[0].split('-')[-1], []).append(f)
+        for year in sorted(years.keys()):
+            sizes = self.getFilesSize(year)
+            for f in years[year]:
+                if f not in sizes or f in self.errors:
+                    continue
+                size = os.path.getsize(os.path.join(self.folder, f))
+                if size != sizes[f]:
+                    error = "size %i, remote size %i" % (size, sizes[f])
+                    self.errors[f] = error
+                    logging.error("The file %s is not valid: %s" % (f, error))
+        return self.errors
+
+    def getStations(self, files):
+        """ Return the sorted list of stations of files """
+        return sorted(set([f.split('.')[0].rsplit('-', 1)[0] for f in files]))
+
+    def removeFiles(self):
+        """ Remove the files not valid, so downGSOD download them again """
+        for f in self.errors.keys():
+            os.remove(os.path.join(self.folder, f))
+            if self.debug == True:
+                logging.debug("File %s removed" % f)
+
+    def writeStations(self, filename):
+        """ Write a list of stations with files not valid for each year, the
+        name of file is filename with the year added before the extension.
+        Each file can be used as file_stations option of downGSOD with the
+        same first and last year, after removeFiles. Return a list of tuple
+        with year and name of file, no file is written without errors """
+        root, ext = os.path.splitext(filename)
+        # group the files by year
+        years = {}
+        for f in self.errors.keys():
+            years.setdefault(f.split('.')[0].split('-')[-1], []).append(f)
+        output = []
+        for year in sorted(years.keys()):
+            yearname = "%s_%s%s" % (root, year, ext)
+            fn = open(yearname, 'w')
+            for station in self.getStations(years[year]):
+                fn.write("%s\n" % station)
+            fn.close()
+            output.append((year, yearname))
+        return output
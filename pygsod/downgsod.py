@@ -98,7 +98,7 @@ class downGSOD:
         LOGGING_FORMAT='%(asctime)s - %(levelname)s - %(message)s'
         logging.basicConfig(filename=LOG_FILENAME, level=logging.DEBUG, \
         format=LOGGING_FORMAT)
-        if self.debug == True:
+        if self.debug == True and self.tiles:
             logging.debug("The number of stations required in: %i" % len(self.tiles))
 
     def readFile(self,filename):
@@ -112,8 +112,11 @@ class downGSOD:
             ........
         """
         fn = open(filename)
-        stations = [x.strip() for x in fn.readlines()]
+        stations = [x.strip() for x in fn.readlines() if x.strip()]
         fn.close()
+        # an empty list means all stations
+        if not stations:
+            raise IOError("File %s does not contain any station" % filename)
         return stations        
         
     def connectFTP(self):
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# script to check the integrity of downloaded GSOD data
+#
+#  (c) Copyright Luca Delucchi 2012
+#  Authors: Luca Delucchi
+#  Email: luca dot delucchi at fmach dot it
+#
+##################################################################
+#
+#  This GSOD Python script is licensed under the terms of GNU GPL 2.
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License as
+#  published by the Free Software Foundation; either version 2 of
+#  the License, or (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+##################################################################
+
+#import system library
+import os
+import logging
+import optparse
+#import gsod library
+from pygsod import checkgsod
+
+def main():
+    """Main function"""
+    #usage
+    usage = "usage: %prog [options] gsod_folder"
+    parser = optparse.OptionParser(usage=usage)
+    #output file
+    parser.add_option("-o", "--output", dest="output", default=None,
+                      help="path to file where write the list of stations' " \
+                      + "code to download again; a file for each year is " \
+                      + "written adding the year to the name, it can be " \
+                      + "used with -F option of gsod_download.py and the " \
+                      + "same year as -f and -e options; it implies -r " \
+                      + "[default=%default]")
+    #remove files
+    parser.add_option("-r", "--remove", action="store_true", dest="remove",
+                      help="remove files not valid, so gsod_download.py " \
+                      + "download them again, otherwise it skips them " \
+                      + "because they already exist")
+    #processes
+    parser.add_option("-j", "--processes", dest="processes", type="int",
+                      default=None, help="the number of processes used to " \
+                      + "check the files [default=number of CPUs]")
+    #password
+    parser.add_option("-P", "--password", dest="password", default=None,
+                      help="password for connect to ftp server, if it is " \
+                      + "set the size of files is compared with remote files")
+    #username
+    parser.add_option("-U", "--username", dest="user", default = "anonymous",
+                      help="username for connect to ftp server")
+    #url
+    parser.add_option("-u", "--url", default = "ftp.ncdc.noaa.gov",
+                      help="ftp server url [default=%default]", dest="url")
+    #debug
+    parser.add_option("-x", action="store_true", dest="debug",
+                      help="this is useful for debug the check")
+    #set false several options
+    parser.set_defaults(debug=False, remove=False)
+
+    #return options and argument
+    (options, args) = parser.parse_args()
+    #test if args[0] it is set
+    if len(args) == 0:
+        parser.error("You have to pass the folder with GSOD files")
+
+    #the list is useful only if the files are removed
+    if options.output:
+        options.remove = True
+    #set logging
+    logging.basicConfig(filename=os.path.join(args[0], 'checkgsod.log'),
+        level=logging.DEBUG,
+        format='%(asctime)s - %(levelname)s - %(message)s')
+    #set check object
+    checkOgg = checkgsod.checkGSOD(folder = args[0],
+        processes = options.processes, debug = options.debug)
+    #check local files
+    checkOgg.checkLocal()
+    #compare with remote files
+    if options.password:
+        checkOgg.connectFTP(url = options.url, user = options.user,
+            password = options.password)
+        checkOgg.checkRemote()
+        checkOgg.closeFTP()
+    #print the files not valid
+    for f in sorted(checkOgg.errors.keys()):
+        print "%s: %s" % (f, checkOgg.errors[f])
+    print "%i files checked, %i not valid" % (len(checkOgg.files),
+                                             len(checkOgg.errors))
+    if not checkOgg.errors:
+        if options.output:
+            print "No files to download again, %s not written" % options.output
+        return
+    if options.output:
+        for year, name in checkOgg.writeStations(options.output):
+            print "gsod_download.py -F %s -f %s -e %s" % (name, year, year)
+    if options.remove:
+        checkOgg.removeFiles()
+
+#add options
+if __name__ == "__main__":
+    main()
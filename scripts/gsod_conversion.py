@@ -27,47 +27,8 @@ import getpass
 
 from optparse import OptionParser
 
-def f2c(temperature):   return "%.1f" % ((float(temperature) - 32.) / 1.8)
-def miles2km(distance): return "%.1f" % (float(distance) / .6214)
-def knots2kmh(speed):   return "%.1f" % (float(speed) / 1.9425)
-def inches2mm(length):  return "%.1f" % (float(length) * 25.4 * 0.1)
+from pygsod.gsodformat import input_format
 
-input_format = [
-    #name, start, end, conversion function, sql type
-    ('stn',1,6,None,'CHAR(6)'),
-    ('wban',8,12,None,'CHAR(6)'),
-    ('year',15,18,None,'INTEGER'),
-    ('month',19,20,None,'INTEGER'),
-    ('day',21,22,None,'INTEGER'),
-    ('temp',25,30,f2c,'FLOAT'),         #temperature; Fahrenheit
-    ('temp_count',32,33,None,'INTEGER'),
-    ('dewp',36,41,f2c,'FLOAT'),         #dew point; Fahrenheit
-    ('dewp_count',43,44,None,'INTEGER'),
-    ('slp',47,52,None,'FLOAT'),         #sea level pressure; millibars
-    ('slp_count',54,55,None,'INTEGER'),
-    ('stp',58,63,None,'FLOAT'),         #station pressure; millibars
-    ('stp_count',65,66,None,'INTEGER'),
-    ('visib',69,73,miles2km,'FLOAT'),   #visibility; miles
-    ('visib_count',75,76,None,'INTEGER'),
-    ('wdsp',79,83,knots2kmh,'FLOAT'),   #wind speed; knots
-    ('wdsp_count',85,86,None,'INTEGER'),
-    ('mxspd',89,93,knots2kmh,'FLOAT'),  #maximum sustained wind speed; knots
-    ('gust',96,100,knots2kmh,'FLOAT'),  #maximum wind gust; knots
-    ('max',103,108,f2c,'FLOAT'),        #maximum temperature; Fahrenheit
-    ('max_flag',109,109,None,'CHAR(1)'),
-    ('min',111,116,f2c,'FLOAT'),        #minimum temperature; Fahrenheit
-    ('min_flag',117,117,None,'CHAR(1)'),
-    ('prcp',119,123,inches2mm,'FLOAT'), #total precipitation (rain/melted snow); inches
-    ('prcp_flag',124,124,None,'CHAR(1)'),
-    ('sndp',126,130,inches2mm,'FLOAT'), #snow depth; inches
-    #the following are flags: 1 yes, 0 no
-    ('fog',133,133,None,'INTEGER'),
-    ('rain',134,134,None,'INTEGER'),      #rain or drizzle
-    ('snow',135,135,None,'INTEGER'),      #snow or ice pellets
-    ('hail',136,136,None,'INTEGER'),     
-    ('thunder',137,137,None,'INTEGER'),
-    ('tornado',138,138,None,'INTEGER'),   #tornado or funnel cloud
-]
 missing_data = re.compile('^9+\.9+$')
 pkey_fields = ('stn', 'wban', 'year', 'month', 'day')
 def threshold_check(lst,threshold):
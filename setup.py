@@ -24,8 +24,9 @@ from distutils.core import setup
 setup(
   name = 'pygsod',
   version = '0.1.0',
-  py_modules = ['pygsod.downgsod'],
-  scripts = ['scripts/gsod_download.py','scripts/gsod_conversion.py'],
+  py_modules = ['pygsod.downgsod','pygsod.checkgsod','pygsod.gsodformat'],
+  scripts = ['scripts/gsod_download.py','scripts/gsod_conversion.py',
+             'scripts/gsod_check.py'],
   author = 'Luca Delucchi',
   author_email = 'luca.delucchi@iasma.it',
   url = 'http://gis.fem-environment.eu/gis-development/pygsod',